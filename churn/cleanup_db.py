@@ -1,11 +1,7 @@
-import sys
-from pathlib import Path
 import mysql.connector
 from mysql.connector import Error
 
-sys.path.append(str(Path(__file__).parent))
-
-from utils import load_config
+from .config import load_config
 
 def cleanup_database():
     print("="*70)
@@ -60,7 +56,7 @@ def cleanup_database():
         print("\n" + "="*70)
         print("Cleanup Complete!")
         print("="*70)
-        print("\nYou can now run: python load_data_to_db.py")
+        print("\nYou can now run: churn load")
         
         cursor.close()
         connection.close()
@@ -70,6 +66,3 @@ def cleanup_database():
         return False
     
     return True
-
-if __name__ == "__main__":
-    cleanup_database()
@@ -0,0 +1,130 @@
+import os
+import argparse
+from pathlib import Path
+
+from .config import CONFIG_ENV_VAR, find_config
+
+# Keep this module cheap to import: the scheduler starts `churn` many times
+# a day, so pandas, numpy and mysql.connector are only imported inside the
+# command that needs them.
+
+EXPORTABLE = (
+    'ml_feature_matrix', 'at_risk_customers', 'high_risk_customers',
+    'customer_complete_profile', 'churn_statistics',
+    'customers', 'service_subscriptions', 'billing_info', 'churn_features'
+)
+
+def cmd_init(args):
+    from .setup_config import setup_config
+
+    # main has already turned --config into CHURN_CONFIG
+    return setup_config(find_config())
+
+def cmd_load(args):
+    from .load_data_to_db import main
+
+    return main()
+
+def cmd_validate(args):
+    from .validate_db import validate_database
+
+    return validate_database()
+
+def cmd_cleanup(args):
+    from .cleanup_db import cleanup_database
+
+    return cleanup_database()
+
+def cmd_stats(args):
+    from .utils import get_table_stats
+
+    stats = get_table_stats()
+    if not stats:
+        print("✗ Could not retrieve table statistics")
+        return False
+
+    print("Table Statistics:")
+    print("-" * 50)
+    for table, count in stats.items():
+        print(f"  {table:30s} : {count:>6d} rows")
+    print("-" * 50)
+
+def cmd_export(args):
+    from .config import load_config
+    from .utils import query_to_dataframe
+
+    output = args.output
+    if output is None:
+        output = Path(load_config()['paths']['processed_data']) / f"{args.name}.csv"
+
+    df = query_to_dataframe(f"SELECT * FROM {args.name}")
+    if df is None:
+        print(f"✗ Failed to export {args.name}")
+        return False
+
+    df.to_csv(output, index=False)
+    print(f"✓ Exported {len(df)} rows from {args.name} to: {output}")
+
+def cmd_rules(args):
+    from .risk_rules import load_risk_rules, compile_risk_views
+
+    try:
+        rules = load_risk_rules()
+    except ValueError as e:
+        print(f"✗ Invalid risk rules: {e}")
+        return False
+
+    # Print the compiled views, e.g. to pipe into the mysql client
+    for statement in compile_risk_views(rules):
+        print(statement)
+        print()
+
+def cmd_drift(args):
+    from .drift_report import main
+
+    return main(current=args.current, baseline=args.baseline, set_baseline=args.set_baseline)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='churn', description="Customer churn data pipeline")
+    parser.add_argument('--config', type=Path,
+                        help=f"path to config.json (default: ${CONFIG_ENV_VAR}, then ./config.json)")
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    subparsers.add_parser('init', help="create config.json interactively").set_defaults(func=cmd_init)
+    subparsers.add_parser('load', help="create the schema, load processed data and build views").set_defaults(func=cmd_load)
+    subparsers.add_parser('validate', help="run data quality checks").set_defaults(func=cmd_validate)
+    subparsers.add_parser('cleanup', help="drop all tables and views").set_defaults(func=cmd_cleanup)
+    subparsers.add_parser('stats', help="print table row counts").set_defaults(func=cmd_stats)
+
+    export = subparsers.add_parser('export', help="export a table or view to CSV")
+    export.add_argument('name', nargs='?', default='ml_feature_matrix', choices=EXPORTABLE, metavar='name',
+                        help="table or view to export (default: ml_feature_matrix)")
+    export.add_argument('-o', '--output', type=Path,
+                        help="output CSV (default: <processed_data>/<name>.csv)")
+    export.set_defaults(func=cmd_export)
+
+    subparsers.add_parser('rules', help="print the risk views compiled from the risk rules").set_defaults(func=cmd_rules)
+
+    drift = subparsers.add_parser('drift', help="compare load-time feature sketches with the baseline")
+    drift.add_argument('--current', type=Path, help="sketch file to check (default: latest load)")
+    drift.add_argument('--baseline', type=Path, help="baseline sketch file (default: baseline.json)")
+    drift.add_argument('--set-baseline', action='store_true',
+                       help="make the current sketch file the new baseline")
+    drift.set_defaults(func=cmd_drift)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # Every command reads the config through load_config, which honours this
+    if args.config:
+        os.environ[CONFIG_ENV_VAR] = str(args.config.expanduser().resolve())
+
+    if args.func is not cmd_init and not find_config().exists():
+        print(f"✗ Config file not found: {find_config()}")
+        print("Run `churn init` or pass --config")
+        return 1
+
+    return 1 if args.func(args) is False else 0
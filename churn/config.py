@@ -0,0 +1,42 @@
+import os
+import json
+from pathlib import Path
+
+CONFIG_ENV_VAR = 'CHURN_CONFIG'
+
+DEFAULT_PATHS = {
+    'raw_data': 'data/raw',
+    'processed_data': 'data/processed',
+    'sql_queries': 'sql_queries',
+    'notebooks': 'notebooks',
+    'sketches': 'data/sketches'
+}
+
+# Every DB helper reads the config, so each file is parsed once per process
+_cache = {}
+
+def find_config():
+    # --config / CHURN_CONFIG, then the working directory
+    if os.environ.get(CONFIG_ENV_VAR):
+        return Path(os.environ[CONFIG_ENV_VAR]).expanduser().resolve()
+
+    return (Path.cwd() / 'config.json').resolve()
+
+def load_config(config_path=None):
+    config_path = Path(config_path).resolve() if config_path else find_config()
+    if config_path in _cache:
+        return _cache[config_path]
+
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+
+    # Relative paths are relative to the config file, not the working directory
+    paths = dict(DEFAULT_PATHS)
+    paths.update(config.get('paths', {}))
+    config['paths'] = {
+        name: str((config_path.parent / Path(value).expanduser()).resolve())
+        for name, value in paths.items()
+    }
+
+    _cache[config_path] = config
+    return config
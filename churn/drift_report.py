@@ -0,0 +1,70 @@
+import shutil
+from pathlib import Path
+
+from .config import load_config
+from .feature_sketches import load_sketches, latest_sketches_path, compare_sketches
+
+def print_drift_report(baseline_path, current_path):
+    baseline_info, baseline = load_sketches(baseline_path)
+    current_info, current = load_sketches(current_path)
+
+    print("="*70)
+    print("Feature Drift Report")
+    print("="*70)
+    print(f"\n  Baseline: {baseline_path.name} ({baseline_info['created_at']}, {baseline.records} records)")
+    print(f"  Current:  {current_path.name} ({current_info['created_at']}, {current.records} records)")
+
+    report = compare_sketches(baseline, current)
+
+    print("\n1. Numeric Features")
+    print("-" * 70)
+    print(f"  {'feature':22s} {'PSI':>7s} {'KS':>7s} {'median (base -> now)':>24s}  status")
+    for row in report:
+        if row['kind'] != 'numeric':
+            continue
+        psi = f"{row['psi']:.3f}" if row['psi'] is not None else 'n/a'
+        ks = f"{row['ks']:.3f}" if row['ks'] is not None else 'n/a'
+        medians = f"{row['baseline_median']} -> {row['current_median']}"
+        print(f"  {row['feature']:22s} {psi:>7s} {ks:>7s} {medians:>24s}  {row['status']}")
+
+    print("\n2. Categorical Features")
+    print("-" * 70)
+    print(f"  {'feature':22s} {'PSI':>7s}  status")
+    for row in report:
+        if row['kind'] != 'categorical':
+            continue
+        psi = f"{row['psi']:.3f}" if row['psi'] is not None else 'n/a'
+        note = f" (new values: {', '.join(row['new_categories'])})" if row['new_categories'] else ''
+        print(f"  {row['feature']:22s} {psi:>7s}  {row['status']}{note}")
+
+    drifted = [row['feature'] for row in report if row['status'] == 'drift']
+    print("\n" + "="*70)
+    if drifted:
+        print(f"⚠ Drift detected in: {', '.join(drifted)}")
+    else:
+        print("✓ No significant drift (PSI < 0.25 for all features)")
+    print("="*70)
+
+    return not drifted
+
+def main(current=None, baseline=None, set_baseline=False):
+    config = load_config()
+    sketches_dir = Path(config['paths']['sketches'])
+
+    current_path = Path(current) if current else latest_sketches_path(sketches_dir)
+    baseline_path = Path(baseline) if baseline else sketches_dir / 'baseline.json'
+
+    if current_path is None or not current_path.exists():
+        print(f"✗ No sketch files found in {sketches_dir}; run `churn load` first")
+        return False
+
+    if set_baseline:
+        shutil.copyfile(current_path, baseline_path)
+        print(f"✓ Baseline set to {current_path.name}")
+        return
+
+    if not baseline_path.exists():
+        print(f"✗ Baseline not found: {baseline_path}")
+        return False
+
+    return print_drift_report(baseline_path, current_path)
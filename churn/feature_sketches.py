@@ -0,0 +1,262 @@
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+import numpy as np
+
+from .features import ML_FEATURES, feature_matrix_columns
+
+# Fixed-bin histogram (low, high, bins) for every numeric feature; values
+# outside a range land in the under/overflow bins
+HISTOGRAM_RANGES = {
+    'tenure_months': (0, 72, 24),
+    'tenure_years': (0, 6, 24),
+    'monthly_charges': (0, 150, 30),
+    'total_charges': (0, 10000, 40),
+    'avg_monthly_spend': (0, 150, 30),
+    'charge_per_tenure': (0, 150, 30)
+}
+
+NUMERIC_FEATURES = tuple(name for name, kind in ML_FEATURES.items() if kind == 'numeric')
+CATEGORICAL_FEATURES = tuple(name for name, kind in ML_FEATURES.items() if kind == 'categorical')
+
+# Keeps the PSI finite when a bin is empty on one side
+_PSI_EPSILON = 1e-4
+
+class Histogram:
+    def __init__(self, low, high, bins, counts=None, missing=0):
+        self.low = low
+        self.high = high
+        self.bins = bins
+        # bins + 2 slots: underflow, the fixed bins, overflow
+        self.counts = np.zeros(bins + 2, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.missing = missing
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        nan = np.isnan(values)
+        self.missing += int(nan.sum())
+        values = values[~nan]
+
+        # Clip before casting: values far outside the range (or infinite)
+        # would overflow int64 and wrap into the wrong bin
+        width = (self.high - self.low) / self.bins
+        position = np.clip(np.floor((values - self.low) / width), -1, self.bins)
+        index = position.astype(np.int64) + 1
+        # The upper edge belongs to the last bin, not to the overflow
+        index[values == self.high] = self.bins
+        self.counts += np.bincount(index, minlength=self.bins + 2)
+
+    def to_dict(self):
+        return {'low': self.low, 'high': self.high, 'bins': self.bins,
+                'counts': self.counts.tolist(), 'missing': self.missing}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['low'], data['high'], data['bins'], data['counts'], data['missing'])
+
+class QuantileSketch:
+    # KLL-style compactor stack: level i holds items of weight 2**i, and a
+    # full level promotes every other sorted item to the next one. Memory
+    # stays around k * log2(n / k) values however large the load is.
+    def __init__(self, k=500, levels=None, count=0):
+        self.k = k
+        self.levels = [[]] if levels is None else [list(level) for level in levels]
+        self.count = count
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.levels[0].extend(values.tolist())
+        self.count += len(values)
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items.sort()
+                # An odd item out stays behind so the total weight is preserved
+                keep = [items.pop()] if len(items) % 2 else []
+                # Alternate the offset between compactions to avoid bias
+                offset = (self.count >> level) & 1
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                self.levels[level + 1].extend(items[offset::2])
+                self.levels[level] = keep
+            level += 1
+
+    def weighted_values(self):
+        values = []
+        weights = []
+        for level, items in enumerate(self.levels):
+            values.extend(items)
+            weights.extend([2 ** level] * len(items))
+        order = np.argsort(values, kind='stable')
+        return np.asarray(values)[order], np.asarray(weights, dtype=np.float64)[order]
+
+    def cdf(self, points):
+        values, weights = self.weighted_values()
+        if len(values) == 0:
+            return np.zeros(len(points))
+        cumulative = np.cumsum(weights) / weights.sum()
+        index = np.searchsorted(values, points, side='right')
+        return np.where(index > 0, cumulative[np.maximum(index - 1, 0)], 0.0)
+
+    def quantiles(self, qs):
+        values, weights = self.weighted_values()
+        if len(values) == 0:
+            return [None] * len(qs)
+        cumulative = np.cumsum(weights) / weights.sum()
+        index = np.searchsorted(cumulative, qs, side='left')
+        return values[np.minimum(index, len(values) - 1)].tolist()
+
+    def to_dict(self):
+        return {'k': self.k, 'levels': self.levels, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['k'], data['levels'], data['count'])
+
+class CategoryCounts:
+    def __init__(self, counts=None):
+        self.counts = {} if counts is None else dict(counts)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        keys, counts = np.unique(values, return_counts=True)
+        for key, count in zip(keys, counts):
+            # JSON keys are strings; NULL groups every missing value
+            key = 'NULL' if np.isnan(key) else str(int(key))
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+
+    def to_dict(self):
+        return {'counts': self.counts}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['counts'])
+
+class FeatureSketches:
+    def __init__(self):
+        self.records = 0
+        self.histograms = {name: Histogram(*HISTOGRAM_RANGES[name]) for name in NUMERIC_FEATURES}
+        self.quantiles = {name: QuantileSketch() for name in NUMERIC_FEATURES}
+        self.categories = {name: CategoryCounts() for name in CATEGORICAL_FEATURES}
+
+    def update(self, df):
+        columns = feature_matrix_columns(df)
+        self.records += len(df)
+        for name in NUMERIC_FEATURES:
+            self.histograms[name].update(columns[name])
+            self.quantiles[name].update(columns[name])
+        for name in CATEGORICAL_FEATURES:
+            self.categories[name].update(columns[name])
+
+    def to_dict(self):
+        return {
+            'records': self.records,
+            'histograms': {name: s.to_dict() for name, s in self.histograms.items()},
+            'quantiles': {name: s.to_dict() for name, s in self.quantiles.items()},
+            'categories': {name: s.to_dict() for name, s in self.categories.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketches = cls()
+        sketches.records = data['records']
+        sketches.histograms = {name: Histogram.from_dict(s) for name, s in data['histograms'].items()}
+        sketches.quantiles = {name: QuantileSketch.from_dict(s) for name, s in data['quantiles'].items()}
+        sketches.categories = {name: CategoryCounts.from_dict(s) for name, s in data['categories'].items()}
+        return sketches
+
+def save_sketches(sketches, sketches_dir, source=None):
+    sketches_dir = Path(sketches_dir)
+    sketches_dir.mkdir(parents=True, exist_ok=True)
+
+    created_at = datetime.now()
+    # Microseconds keep back-to-back loads from overwriting each other
+    path = sketches_dir / f"load_{created_at:%Y%m%d_%H%M%S_%f}.json"
+    payload = {
+        'created_at': created_at.isoformat(timespec='seconds'),
+        'source': str(source) if source else None,
+        'sketches': sketches.to_dict()
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f)
+
+    # The first load ever recorded becomes the drift baseline
+    baseline_path = sketches_dir / 'baseline.json'
+    if not baseline_path.exists():
+        with open(baseline_path, 'w') as f:
+            json.dump(payload, f)
+
+    return path
+
+def load_sketches(path):
+    with open(path, 'r') as f:
+        payload = json.load(f)
+    return payload, FeatureSketches.from_dict(payload['sketches'])
+
+def latest_sketches_path(sketches_dir):
+    loads = sorted(Path(sketches_dir).glob('load_*.json'))
+    return loads[-1] if loads else None
+
+def population_stability_index(expected_counts, actual_counts):
+    expected = np.asarray(expected_counts, dtype=np.float64)
+    actual = np.asarray(actual_counts, dtype=np.float64)
+    if expected.sum() == 0 or actual.sum() == 0:
+        return None
+    expected = np.maximum(expected / expected.sum(), _PSI_EPSILON)
+    actual = np.maximum(actual / actual.sum(), _PSI_EPSILON)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+def ks_statistic(baseline_sketch, current_sketch):
+    # Largest CDF gap, evaluated at every value retained by either sketch
+    points = np.unique(np.concatenate([
+        np.asarray(baseline_sketch.weighted_values()[0]),
+        np.asarray(current_sketch.weighted_values()[0])
+    ]))
+    if len(points) == 0:
+        return None
+    return float(np.max(np.abs(baseline_sketch.cdf(points) - current_sketch.cdf(points))))
+
+def psi_status(psi):
+    if psi is None or math.isnan(psi):
+        return 'n/a'
+    if psi < 0.1:
+        return 'stable'
+    if psi < 0.25:
+        return 'moderate'
+    return 'drift'
+
+def compare_sketches(baseline, current):
+    report = []
+
+    for name in NUMERIC_FEATURES:
+        psi = population_stability_index(baseline.histograms[name].counts,
+                                         current.histograms[name].counts)
+        ks = ks_statistic(baseline.quantiles[name], current.quantiles[name])
+        base_median, = baseline.quantiles[name].quantiles([0.5])
+        current_median, = current.quantiles[name].quantiles([0.5])
+        report.append({
+            'feature': name, 'kind': 'numeric', 'psi': psi, 'ks': ks,
+            'baseline_median': base_median, 'current_median': current_median,
+            'status': psi_status(psi)
+        })
+
+    for name in CATEGORICAL_FEATURES:
+        base_counts = baseline.categories[name].counts
+        current_counts = current.categories[name].counts
+        keys = sorted(set(base_counts) | set(current_counts))
+        psi = population_stability_index([base_counts.get(k, 0) for k in keys],
+                                         [current_counts.get(k, 0) for k in keys])
+        new_categories = [k for k in keys if k not in base_counts]
+        report.append({
+            'feature': name, 'kind': 'categorical', 'psi': psi, 'ks': None,
+            'new_categories': new_categories,
+            'status': 'drift' if new_categories else psi_status(psi)
+        })
+
+    return report
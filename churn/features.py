@@ -0,0 +1,82 @@
+# Single Python description of the ml_feature_matrix view
+# (sql_queries/feature_extraction.sql); risk rules and load-time sketches
+# both work on these columns
+
+CONTRACT_MAP = {0: 'Month-to-month', 1: 'One year', 2: 'Two year'}
+INTERNET_MAP = {0: 'No', 1: 'DSL', 2: 'Fiber optic'}
+
+# Thresholds of the derived flags in the view
+LONG_TERM_MONTHS = 24
+HIGH_MONTHLY_CHARGES = 70
+MULTI_SERVICE_COUNT = 4
+
+# ml_feature_matrix columns (besides customer_id) and whether they hold a
+# continuous value or a small set of codes
+ML_FEATURES = {
+    'is_male': 'categorical',
+    'senior_citizen': 'categorical',
+    'has_partner': 'categorical',
+    'has_dependents': 'categorical',
+    'tenure_months': 'numeric',
+    'tenure_years': 'numeric',
+    'is_long_term': 'categorical',
+    'phone_service': 'categorical',
+    'internet_service_type': 'categorical',
+    'total_services': 'categorical',
+    'has_streaming': 'categorical',
+    'has_security': 'categorical',
+    'has_support': 'categorical',
+    'contract_level': 'categorical',
+    'paperless_billing': 'categorical',
+    'monthly_charges': 'numeric',
+    'total_charges': 'numeric',
+    'avg_monthly_spend': 'numeric',
+    'charge_per_tenure': 'numeric',
+    'auto_payment': 'categorical',
+    'has_family': 'categorical',
+    'high_monthly_charges': 'categorical',
+    'multi_service_user': 'categorical',
+    'target_churn': 'categorical'
+}
+
+TARGET_FEATURE = 'target_churn'
+
+def _stored_code(codes, mapping, default):
+    # Codes go through the same lookup as transform_rows, so an unknown code
+    # becomes the stored default, exactly as the view will read it back
+    labels = codes.map(mapping).fillna(mapping[default])
+    return labels.map({label: code for code, label in mapping.items()})
+
+def feature_matrix_columns(df):
+    # ml_feature_matrix computed from a processed CSV chunk, so it can be
+    # inspected without querying the view after the load
+    tenure = df['tenure'].astype(float)
+    monthly_charges = df['MonthlyCharges'].astype(float).round(2)
+    total_services = df['total_services']
+
+    return {
+        'is_male': (df['gender_encoded'] == 1).astype(int),
+        'senior_citizen': df['SeniorCitizen'],
+        'has_partner': df['partner_encoded'],
+        'has_dependents': df['dependents_encoded'],
+        'tenure_months': tenure,
+        'tenure_years': (tenure / 12.0).round(2),
+        'is_long_term': (tenure > LONG_TERM_MONTHS).astype(int),
+        'phone_service': df['phone_service_encoded'],
+        'internet_service_type': _stored_code(df['internet_service_encoded'], INTERNET_MAP, 0),
+        'total_services': total_services,
+        'has_streaming': df['has_streaming'],
+        'has_security': df['has_security'],
+        'has_support': df['has_support'],
+        'contract_level': _stored_code(df['contract_encoded'], CONTRACT_MAP, 0),
+        'paperless_billing': df['paperless_billing_encoded'],
+        'monthly_charges': monthly_charges,
+        'total_charges': df['TotalCharges'].astype(float).round(2),
+        'avg_monthly_spend': df['avg_monthly_spend'].astype(float).round(2),
+        'charge_per_tenure': df['charge_per_tenure'].astype(float).round(2),
+        'auto_payment': df['auto_payment'],
+        'has_family': ((df['partner_encoded'] == 1) | (df['dependents_encoded'] == 1)).astype(int),
+        'high_monthly_charges': (monthly_charges > HIGH_MONTHLY_CHARGES).astype(int),
+        'multi_service_user': (total_services >= MULTI_SERVICE_COUNT).astype(int),
+        'target_churn': df['churn_encoded']
+    }
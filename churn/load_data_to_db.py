@@ -1,15 +1,16 @@
-import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent))
-
-from utils import (
-    load_config, 
+from .config import load_config
+from .utils import (
     execute_sql_file, 
+    execute_sql_statements,
     load_data_to_db, 
     get_table_stats,
     query_to_dataframe
 )
+from .pipeline_loader import load_data_to_db_pipelined
+from .risk_rules import load_risk_rules, compile_risk_views
+from .feature_sketches import FeatureSketches, save_sketches
 
 def main():
     print("="*70)
@@ -18,9 +19,17 @@ def main():
     
     config = load_config()
     
+    # Bad rules would otherwise only show up after the data is loaded
+    try:
+        risk_rules = load_risk_rules(config)
+    except ValueError as e:
+        print(f"✗ Invalid risk rules: {e}")
+        return False
+    
     # Paths
     sql_dir = Path(config['paths']['sql_queries'])
     processed_dir = Path(config['paths']['processed_data'])
+    sketches_dir = Path(config['paths']['sketches'])
     
     db_init_sql = sql_dir / 'db_init.sql'
     feature_sql = sql_dir / 'feature_extraction.sql'
@@ -32,22 +41,37 @@ def main():
             print("✓ Database schema created successfully")
         else:
             print("✗ Failed to create database schema")
-            return
+            return False
     else:
         print(f"✗ SQL file not found: {db_init_sql}")
-        return
+        return False
     
     print("\n[2/4] Loading processed data into database...")
     if processed_csv.exists():
-        if load_data_to_db(processed_csv):
+        loader_config = config.get('loader', {})
+        sketches = FeatureSketches()
+        if loader_config.get('pipelined', False):
+            loaded = load_data_to_db_pipelined(
+                processed_csv,
+                chunk_size=loader_config.get('chunk_size', 500),
+                writers=loader_config.get('writers', 4),
+                queue_size=loader_config.get('queue_size', 4),
+                sketches=sketches
+            )
+        else:
+            loaded = load_data_to_db(processed_csv, sketches=sketches)
+        
+        if loaded:
             print("✓ Data loaded successfully")
+            sketch_path = save_sketches(sketches, sketches_dir, source=processed_csv)
+            print(f"✓ Feature sketches saved to: {sketch_path}")
         else:
             print("✗ Failed to load data")
-            return
+            return False
     else:
         print(f"✗ Processed data file not found: {processed_csv}")
         print("Please run the preprocessing notebook first")
-        return
+        return False
     
     print("\n[3/4] Creating feature extraction views...")
     if feature_sql.exists():
@@ -55,10 +79,17 @@ def main():
             print("✓ Feature extraction views created")
         else:
             print("✗ Failed to create views")
-            return
+            return False
+        
+        risk_views = compile_risk_views(risk_rules)
+        if execute_sql_statements(risk_views, 'risk rules'):
+            print("✓ Risk views created")
+        else:
+            print("✗ Failed to create risk views")
+            return False
     else:
         print(f"✗ SQL file not found: {feature_sql}")
-        return
+        return False
     
     print("\n[4/4] Verifying data integrity...")
     stats = get_table_stats()
@@ -75,7 +106,7 @@ def main():
             print("⚠ Some tables are empty")
     else:
         print("✗ Could not retrieve table statistics")
-        return
+        return False
     
     print("\n" + "="*70)
     print("Database Setup Complete!")
@@ -112,6 +143,5 @@ def main():
     print("  2. Run feature extraction queries for analysis")
     print("  3. Proceed to Milestone 2: AI Model Integration")
     print("="*70)
-
-if __name__ == "__main__":
-    main()
+    
+    return True
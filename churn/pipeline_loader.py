@@ -0,0 +1,220 @@
+import time
+import queue
+import threading
+import pandas as pd
+from mysql.connector import Error, errorcode
+
+from .utils import get_db_connection, transform_rows, write_rows
+
+# Sentinel telling the next stage that its producer has finished
+_DONE = object()
+
+# How often blocked stages wake up to check whether the pipeline was aborted
+_POLL_SECONDS = 0.1
+
+# Concurrent upserts into FK-linked InnoDB tables can deadlock or time out
+# waiting for a lock; InnoDB rolls the loser back, so the batch is retried
+_RETRYABLE_ERRORS = (errorcode.ER_LOCK_DEADLOCK, errorcode.ER_LOCK_WAIT_TIMEOUT)
+_BATCH_RETRIES = 3
+_RETRY_BACKOFF_SECONDS = 0.2
+
+class StageMetrics:
+    def __init__(self, name):
+        self.name = name
+        self.busy_seconds = 0.0
+        self.starved_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.batches = 0
+        self.records = 0
+        self._lock = threading.Lock()
+
+    def add(self, busy=0.0, starved=0.0, blocked=0.0, batches=0, records=0):
+        # Writer threads share one metrics object, so updates are locked
+        with self._lock:
+            self.busy_seconds += busy
+            self.starved_seconds += starved
+            self.blocked_seconds += blocked
+            self.batches += batches
+            self.records += records
+
+    def utilization(self, wall_seconds, workers=1):
+        if wall_seconds <= 0:
+            return 0.0
+        return self.busy_seconds / (wall_seconds * workers)
+
+def _put(q, item, abort, metrics):
+    # Blocks while the queue is full (backpressure) but gives up on abort
+    start = time.perf_counter()
+    try:
+        while not abort.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+    finally:
+        metrics.add(blocked=time.perf_counter() - start)
+
+def _get(q, abort, metrics):
+    start = time.perf_counter()
+    try:
+        while not abort.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
+    finally:
+        metrics.add(starved=time.perf_counter() - start)
+
+def _fail(errors, abort, stage, e):
+    errors.append(f"{stage}: {e}")
+    abort.set()
+
+def _reader(csv_file_path, chunk_size, out_q, abort, errors, metrics):
+    try:
+        chunks = pd.read_csv(csv_file_path, chunksize=chunk_size)
+        while not abort.is_set():
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            metrics.add(busy=time.perf_counter() - start)
+            if chunk is None:
+                break
+            metrics.add(batches=1, records=len(chunk))
+            if not _put(out_q, chunk, abort, metrics):
+                return
+    except Exception as e:
+        _fail(errors, abort, metrics.name, e)
+    finally:
+        _put(out_q, _DONE, abort, metrics)
+
+def _transformer(in_q, out_q, writers, sketches, abort, errors, metrics):
+    try:
+        while True:
+            chunk = _get(in_q, abort, metrics)
+            if chunk is _DONE:
+                break
+
+            start = time.perf_counter()
+            rows = transform_rows(chunk)
+            if sketches is not None:
+                sketches.update(chunk)
+            metrics.add(busy=time.perf_counter() - start, batches=1, records=len(chunk))
+
+            if not _put(out_q, (len(chunk), rows), abort, metrics):
+                return
+    except Exception as e:
+        _fail(errors, abort, metrics.name, e)
+    finally:
+        # One sentinel per writer so that every writer thread exits
+        for _ in range(writers):
+            _put(out_q, _DONE, abort, metrics)
+
+def _write_batch(connection, cursor, rows):
+    for attempt in range(_BATCH_RETRIES + 1):
+        try:
+            write_rows(cursor, rows)
+            connection.commit()
+            return
+        except Error as e:
+            connection.rollback()
+            if e.errno not in _RETRYABLE_ERRORS or attempt == _BATCH_RETRIES:
+                raise
+            time.sleep(_RETRY_BACKOFF_SECONDS * (attempt + 1))
+
+def _writer(in_q, abort, errors, metrics):
+    connection = get_db_connection()
+    if not connection:
+        _fail(errors, abort, metrics.name, "could not connect to MySQL")
+        return
+
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        while True:
+            batch = _get(in_q, abort, metrics)
+            if batch is _DONE:
+                break
+
+            count, rows = batch
+            start = time.perf_counter()
+            # Each batch carries all four tables for the same customers, so
+            # foreign keys hold without ordering batches across writers
+            _write_batch(connection, cursor, rows)
+            metrics.add(busy=time.perf_counter() - start, batches=1, records=count)
+    except Exception as e:
+        _fail(errors, abort, metrics.name, e)
+        try:
+            connection.rollback()
+        except Error:
+            pass
+    finally:
+        if connection.is_connected():
+            if cursor:
+                cursor.close()
+            connection.close()
+
+def print_pipeline_metrics(stages, wall_seconds):
+    print("\nPipeline Stage Metrics:")
+    print("-" * 70)
+    print(f"  {'stage':12s} {'workers':>7s} {'batches':>8s} {'records':>8s} "
+          f"{'busy(s)':>8s} {'starved(s)':>10s} {'blocked(s)':>10s} {'util':>6s}")
+    for metrics, workers in stages:
+        print(f"  {metrics.name:12s} {workers:>7d} {metrics.batches:>8d} {metrics.records:>8d} "
+              f"{metrics.busy_seconds:>8.2f} {metrics.starved_seconds:>10.2f} "
+              f"{metrics.blocked_seconds:>10.2f} {metrics.utilization(wall_seconds, workers):>6.1%}")
+    print("-" * 70)
+    print(f"  Wall time: {wall_seconds:.2f}s")
+
+def load_data_to_db_pipelined(csv_file_path, chunk_size=500, writers=4, queue_size=4, sketches=None):
+    # Reader -> transform -> N writers, connected by bounded queues so a slow
+    # stage throttles the ones before it instead of buffering the whole file
+    # (queue.Queue treats a size <= 0 as unbounded, and no writer deadlocks)
+    for name, value in (('chunk_size', chunk_size), ('writers', writers), ('queue_size', queue_size)):
+        if not isinstance(value, int) or value < 1:
+            raise ValueError(f"Pipelined loader needs {name} >= 1, got {value!r}")
+
+    abort = threading.Event()
+    errors = []
+
+    parsed_q = queue.Queue(maxsize=queue_size)
+    encoded_q = queue.Queue(maxsize=queue_size)
+
+    reader_metrics = StageMetrics('reader')
+    transform_metrics = StageMetrics('transform')
+    writer_metrics = StageMetrics('writer')
+
+    threads = [
+        threading.Thread(target=_reader, name='loader-reader',
+                         args=(csv_file_path, chunk_size, parsed_q, abort, errors, reader_metrics)),
+        threading.Thread(target=_transformer, name='loader-transform',
+                         args=(parsed_q, encoded_q, writers, sketches, abort, errors, transform_metrics))
+    ]
+    for i in range(writers):
+        threads.append(threading.Thread(target=_writer, name=f'loader-writer-{i}',
+                                        args=(encoded_q, abort, errors, writer_metrics)))
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - start
+
+    print_pipeline_metrics([
+        (reader_metrics, 1),
+        (transform_metrics, 1),
+        (writer_metrics, writers)
+    ], wall_seconds)
+
+    if errors:
+        for error in errors:
+            print(f"Error loading data: {error}")
+        # Batches are committed independently; rerunning is safe because
+        # every insert is an upsert
+        print(f"Committed {writer_metrics.records} records before the failure")
+        return False
+
+    print(f"Successfully loaded {writer_metrics.records} records into database")
+    return True
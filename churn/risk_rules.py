@@ -0,0 +1,189 @@
+import math
+
+from .config import load_config
+from .features import ML_FEATURES, TARGET_FEATURE
+
+# Rules may only reference ml_feature_matrix columns (never the target); this
+# also keeps config values from being pasted into SQL as arbitrary identifiers
+RISK_FEATURES = tuple(name for name in ML_FEATURES if name != TARGET_FEATURE)
+
+_SQL_OPERATORS = {'<': '<', '<=': '<=', '>': '>', '>=': '>=', '=': '=', '!=': '<>'}
+# NumPy ufunc names; numpy itself is only imported by the scorer so that
+# compiling the SQL views stays cheap
+_NUMPY_OPERATORS = {
+    '<': 'less', '<=': 'less_equal', '>': 'greater', '>=': 'greater_equal',
+    '=': 'equal', '!=': 'not_equal'
+}
+
+# A rule adds its weight to the score when all of its conditions hold.
+# Categories are checked in order against the minimum score.
+DEFAULT_RISK_RULES = {
+    'rules': [
+        {'name': 'new_customer', 'weight': 3, 'when': [['tenure_months', '<', 12]]},
+        {'name': 'month_to_month', 'weight': 3, 'when': [['contract_level', '=', 0]]},
+        {'name': 'few_services', 'weight': 2, 'when': [['total_services', '<', 2]]},
+        {'name': 'no_family', 'weight': 1, 'when': [['has_family', '=', 0]]},
+        {'name': 'expensive_low_engagement', 'weight': 2,
+         'when': [['monthly_charges', '>', 70], ['total_services', '<', 3]]}
+    ],
+    'categories': [['High Risk', 6], ['Medium Risk', 3]],
+    'default_category': 'Low Risk',
+    'high_risk_category': 'High Risk'
+}
+
+def _is_number(value):
+    # json parses Infinity and NaN, neither of which is a valid SQL literal
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+def _is_sequence(value, length=None):
+    return isinstance(value, list) and (length is None or len(value) == length)
+
+def load_risk_rules(config=None):
+    if config is None:
+        config = load_config()
+    overrides = config.get('risk_rules', {})
+    if not isinstance(overrides, dict):
+        raise ValueError("risk_rules must be an object")
+    rules = dict(DEFAULT_RISK_RULES)
+    rules.update(overrides)
+
+    if not _is_sequence(rules['rules']):
+        raise ValueError("Risk rules must be a list")
+    if not rules['rules']:
+        raise ValueError("At least one risk rule is required")
+    if not _is_sequence(rules['categories']):
+        raise ValueError("Risk categories must be a list")
+    if not rules['categories']:
+        raise ValueError("At least one risk category is required")
+
+    for rule in rules['rules']:
+        if not isinstance(rule, dict) or not isinstance(rule.get('name'), str) or not rule['name']:
+            raise ValueError(f"Every risk rule needs a name, got {rule!r}")
+        if not _is_number(rule.get('weight')):
+            raise ValueError(f"Risk rule {rule['name']!r} needs a finite numeric weight")
+        if not _is_sequence(rule.get('when')) or not rule['when']:
+            raise ValueError(f"Risk rule {rule['name']!r} has no conditions")
+        for condition in rule['when']:
+            if not _is_sequence(condition, 3):
+                raise ValueError(f"Risk rule {rule['name']!r}: condition {condition!r} "
+                                 "must be [feature, operator, threshold]")
+            column, op, value = condition
+            if column not in RISK_FEATURES:
+                raise ValueError(f"Risk rule {rule['name']!r}: unknown feature {column!r}")
+            if op not in _SQL_OPERATORS:
+                raise ValueError(f"Risk rule {rule['name']!r}: unsupported operator {op!r}")
+            if not _is_number(value):
+                raise ValueError(f"Risk rule {rule['name']!r}: threshold for {column!r} must be a finite number")
+
+    for category in rules['categories']:
+        if not _is_sequence(category, 2) or not isinstance(category[0], str):
+            raise ValueError(f"Risk category {category!r} must be [name, minimum score]")
+        name, min_score = category
+        if not _is_number(min_score):
+            raise ValueError(f"Risk category {name!r} needs a finite numeric minimum score")
+
+    if not isinstance(rules['default_category'], str):
+        raise ValueError(f"Default risk category {rules['default_category']!r} must be a string")
+
+    category_names = [name for name, _ in rules['categories']]
+    if rules['high_risk_category'] not in category_names:
+        raise ValueError(f"Unknown high risk category {rules['high_risk_category']!r}")
+
+    return rules
+
+def _sql_string(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+def risk_score_sql(rules, prefix=''):
+    terms = []
+    for rule in rules['rules']:
+        conditions = ' AND '.join(
+            f"{prefix}{column} {_SQL_OPERATORS[op]} {value!r}"
+            for column, op, value in rule['when']
+        )
+        terms.append(f"(CASE WHEN {conditions} THEN {rule['weight']!r} ELSE 0 END)")
+    return '(\n        ' + ' +\n        '.join(terms) + '\n    )'
+
+def risk_category_sql(rules, score_column='risk_score'):
+    branches = ''.join(
+        f"\n        WHEN {score_column} >= {min_score!r} THEN {_sql_string(name)}"
+        for name, min_score in rules['categories']
+    )
+    return f"CASE{branches}\n        ELSE {_sql_string(rules['default_category'])}\n    END"
+
+def compile_risk_views(rules):
+    at_risk_view = f"""
+CREATE OR REPLACE VIEW at_risk_customers AS
+SELECT
+    customer_id,
+    tenure_months,
+    contract_level,
+    total_services,
+    monthly_charges,
+    has_family,
+    risk_score,
+    {risk_category_sql(rules)} as risk_category,
+    actual_churn
+FROM (
+    SELECT
+        m.*,
+        {risk_score_sql(rules, prefix='m.')} as risk_score,
+        m.target_churn as actual_churn
+    FROM ml_feature_matrix m
+) scored
+ORDER BY risk_score DESC;"""
+
+    # Selected by category rather than by score so it always matches the
+    # first-match order used by at_risk_customers and categorize_scores
+    high_risk_view = f"""
+CREATE OR REPLACE VIEW high_risk_customers AS
+SELECT
+    p.customer_id,
+    p.tenure_months,
+    p.monthly_charges,
+    p.contract_type,
+    p.total_services,
+    p.churn
+FROM customer_complete_profile p
+JOIN at_risk_customers a ON p.customer_id = a.customer_id
+WHERE a.risk_category = {_sql_string(rules['high_risk_category'])}
+ORDER BY p.tenure_months ASC;"""
+
+    return [at_risk_view.strip(), high_risk_view.strip()]
+
+def score_customers(features, rules):
+    # features maps column name -> array (a DataFrame works too); scalars
+    # score a single customer. Missing values never match, like NULL in SQL.
+    import numpy as np
+
+    columns = {}
+    scores = None
+
+    for rule in rules['rules']:
+        matched = None
+        for column, op, value in rule['when']:
+            if column not in columns:
+                values = np.asarray(features[column])
+                if values.dtype.kind not in 'biuf':
+                    values = values.astype(np.float64)
+                columns[column] = values
+            values = columns[column]
+            condition = getattr(np, _NUMPY_OPERATORS[op])(values, value)
+            if values.dtype.kind == 'f':
+                condition &= ~np.isnan(values)
+            matched = condition if matched is None else matched & condition
+
+        contribution = np.where(matched, rule['weight'], 0)
+        scores = contribution if scores is None else scores + contribution
+
+    return scores
+
+def categorize_scores(scores, rules):
+    import numpy as np
+
+    scores = np.asarray(scores)
+    return np.select(
+        [scores >= min_score for _, min_score in rules['categories']],
+        [name for name, _ in rules['categories']],
+        default=rules['default_category']
+    )
@@ -1,17 +1,19 @@
-import os
-import sys
 import json
+import importlib.util
 from pathlib import Path
 
-def setup_config():
+from .config import DEFAULT_PATHS
+
+def setup_config(config_path):
     print("=== AI-Enhanced Data Pipeline - Configuration Setup ===\n")
     
-    base_dir = Path(r"C:\Users\Khalid Abdelaty\depii r3\milestone_1")
+    # Paths are stored relative to the config file, so the project can live anywhere
+    config_path = Path(config_path).resolve()
+    base_dir = config_path.parent
     
     if not base_dir.exists():
         print(f"Error: Directory {base_dir} does not exist.")
-        print("Please run setup_project.bat first!")
-        return
+        return False
     
     config = {
         "database": {
@@ -21,12 +23,7 @@ def setup_config():
             "password": "",
             "database": "customer_churn_db"
         },
-        "paths": {
-            "raw_data": str(base_dir / "data" / "raw"),
-            "processed_data": str(base_dir / "data" / "processed"),
-            "sql_queries": str(base_dir / "sql_queries"),
-            "notebooks": str(base_dir / "notebooks")
-        }
+        "paths": dict(DEFAULT_PATHS)
     }
     
     print("MySQL Database Configuration")
@@ -38,7 +35,6 @@ def setup_config():
     if db_name:
         config["database"]["database"] = db_name
     
-    config_path = base_dir / "config.json"
     with open(config_path, 'w') as f:
         json.dump(config, f, indent=4)
     
@@ -55,15 +51,19 @@ def setup_config():
         "jupyter"
     ]
     
+    # Look the packages up without importing them; importing all of them
+    # would take longer than the rest of the command
+    import_names = {"mysql-connector-python": "mysql.connector", "scikit-learn": "sklearn"}
+    
     missing = []
     for package in required_packages:
         try:
-            if package == "mysql-connector-python":
-                __import__("mysql.connector")
-            else:
-                __import__(package)
+            found = importlib.util.find_spec(import_names.get(package, package)) is not None
+        except ModuleNotFoundError:
+            found = False
+        if found:
             print(f"✓ {package}")
-        except ImportError:
+        else:
             print(f"✗ {package} - MISSING")
             missing.append(package)
     
@@ -77,9 +77,6 @@ def setup_config():
     print("\n=== Setup Complete ===")
     print(f"Project root: {base_dir}")
     print("\nNext steps:")
-    print("1. Place your CSV file in: data\\raw\\")
+    print("1. Place your CSV file in: data/raw/")
     print("2. Run the Jupyter notebooks in order")
-    print("3. Execute SQL scripts to set up the database")
-
-if __name__ == "__main__":
-    setup_config()
+    print("3. Set up and load the database with: churn load")
@@ -1,16 +1,13 @@
-import sys
-from pathlib import Path
-import pandas as pd
-
-sys.path.append(str(Path(__file__).parent))
-
-from utils import query_to_dataframe, get_table_stats
+from .utils import query_to_dataframe, get_table_stats
 
 def validate_database():
     print("="*70)
     print("Database Validation Report")
     print("="*70)
     
+    # Warnings (⚠) are informational; any ✗ or missing data fails validation
+    passed = True
+    
     print("\n1. Table Row Counts")
     print("-" * 70)
     stats = get_table_stats()
@@ -23,10 +20,11 @@ def validate_database():
         if all(count == total_records for count in stats.values()):
             print("\n  ✓ All tables have consistent record counts")
         else:
-            print("\n  ⚠ Warning: Inconsistent record counts detected")
+            print("\n  ✗ Inconsistent record counts detected")
+            passed = False
     else:
         print("  ✗ Could not retrieve table statistics")
-        return
+        return False
     
     print("\n2. Data Quality Checks")
     print("-" * 70)
@@ -47,10 +45,14 @@ def validate_database():
         if null_counts.sum() == 0:
             print("  ✓ No NULL values in critical fields")
         else:
-            print("  ⚠ Found NULL values:")
+            print("  ✗ Found NULL values:")
             for col, count in null_counts.items():
                 if count > 0:
                     print(f"    - {col}: {count} nulls")
+            passed = False
+    else:
+        print("  ✗ Could not check for NULL values")
+        passed = False
     
     # Check for duplicate customers
     dup_query = """
@@ -64,6 +66,10 @@ def validate_database():
             print("  ✓ No duplicate customer IDs")
         else:
             print(f"  ✗ Found {dup_count} duplicate customer IDs")
+            passed = False
+    else:
+        print("  ✗ Could not check for duplicate customer IDs")
+        passed = False
     
     # Check data ranges
     range_query = """
@@ -128,6 +134,10 @@ def validate_database():
             print(f"  ✓ ML feature matrix complete: {feature_count} records")
         else:
             print(f"  ✗ ML feature matrix incomplete: {feature_count}/{total_records} records")
+            passed = False
+    else:
+        print("  ✗ Could not read the ML feature matrix")
+        passed = False
     
     # Check feature distributions
     dist_query = """
@@ -165,15 +175,15 @@ def validate_database():
             print(f"  ✓ {view:30s} : {count:>6d} rows")
         else:
             print(f"  ✗ {view:30s} : ERROR")
+            passed = False
     
     print("\n" + "="*70)
     print("Validation Complete")
     print("="*70)
     
     print("\nSummary:")
-    print("  - All critical checks passed" if stats else "  - Some checks failed")
-    print("  - Database is ready for model training" if stats else "  - Please review errors above")
+    print("  - All critical checks passed" if passed else "  - Some checks failed")
+    print("  - Database is ready for model training" if passed else "  - Please review errors above")
     print("="*70)
-
-if __name__ == "__main__":
-    validate_database()
+    
+    return passed
@@ -124,19 +124,7 @@ SELECT
 FROM customer_complete_profile;
 
 -- High risk customers view
-CREATE OR REPLACE VIEW high_risk_customers AS
-SELECT 
-    customer_id,
-    tenure_months,
-    monthly_charges,
-    contract_type,
-    total_services,
-    churn
-FROM customer_complete_profile
-WHERE 
-    (tenure_months < 12 AND contract_type = 'Month-to-month')
-    OR (total_services < 2)
-    OR (monthly_charges > 70 AND total_services < 3)
-ORDER BY tenure_months ASC;
+-- Built from the risk rules in churn/risk_rules.py (after ml_feature_matrix
+-- exists); run `churn rules` to print its definition
 
 SHOW TABLES;
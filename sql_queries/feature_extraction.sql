@@ -174,48 +174,11 @@ JOIN billing_info b ON c.customer_id = b.customer_id
 JOIN churn_features f ON c.customer_id = f.customer_id;
 
 -- 10. Identify At-Risk Customers
--- Customers with high churn probability based on historical patterns
-CREATE OR REPLACE VIEW at_risk_customers AS
-SELECT 
-    customer_id,
-    tenure_months,
-    contract_level,
-    total_services,
-    monthly_charges,
-    has_family,
-    
-    -- Risk score calculation
-    (
-        (CASE WHEN tenure_months < 12 THEN 3 ELSE 0 END) +
-        (CASE WHEN contract_level = 0 THEN 3 ELSE 0 END) +
-        (CASE WHEN total_services < 2 THEN 2 ELSE 0 END) +
-        (CASE WHEN has_family = 0 THEN 1 ELSE 0 END) +
-        (CASE WHEN monthly_charges > 70 AND total_services < 3 THEN 2 ELSE 0 END)
-    ) as risk_score,
-    
-    CASE 
-        WHEN (
-            (CASE WHEN tenure_months < 12 THEN 3 ELSE 0 END) +
-            (CASE WHEN contract_level = 0 THEN 3 ELSE 0 END) +
-            (CASE WHEN total_services < 2 THEN 2 ELSE 0 END) +
-            (CASE WHEN has_family = 0 THEN 1 ELSE 0 END) +
-            (CASE WHEN monthly_charges > 70 AND total_services < 3 THEN 2 ELSE 0 END)
-        ) >= 6 THEN 'High Risk'
-        WHEN (
-            (CASE WHEN tenure_months < 12 THEN 3 ELSE 0 END) +
-            (CASE WHEN contract_level = 0 THEN 3 ELSE 0 END) +
-            (CASE WHEN total_services < 2 THEN 2 ELSE 0 END) +
-            (CASE WHEN has_family = 0 THEN 1 ELSE 0 END) +
-            (CASE WHEN monthly_charges > 70 AND total_services < 3 THEN 2 ELSE 0 END)
-        ) >= 3 THEN 'Medium Risk'
-        ELSE 'Low Risk'
-    END as risk_category,
-    
-    target_churn as actual_churn
-    
-FROM ml_feature_matrix
-ORDER BY risk_score DESC;
+-- The at_risk_customers and high_risk_customers views are compiled from the
+-- configurable risk rules in churn/risk_rules.py, which also provide the
+-- matching in-memory scorer. `churn load` creates them right after this
+-- file; run `churn rules` to print their definitions.
 
 -- Summary: Show view information
 SELECT 'Feature extraction queries completed' AS status;
-SELECT 'Views created: ml_feature_matrix, at_risk_customers' AS info;
+SELECT 'Views created: ml_feature_matrix' AS info;
@@ -0,0 +1,48 @@
+import pytest
+
+PAYMENT_METHODS = ('Bank transfer (automatic)', 'Credit card (automatic)', 'Electronic check', 'Mailed check')
+
+@pytest.fixture
+def processed_frame():
+    # Builds a frame shaped like customer_churn_processed.csv (the output of
+    # 02_preprocessing.ipynb); shift moves every charge column up
+    np = pytest.importorskip('numpy')
+    pd = pytest.importorskip('pandas')
+
+    def make(n, shift=0.0, seed=0):
+        rng = np.random.default_rng(seed)
+        tenure = rng.integers(0, 73, n)
+        monthly = np.round(rng.uniform(18, 119, n) + shift, 2)
+        total = np.round(monthly * tenure, 2)
+        payment = rng.integers(0, len(PAYMENT_METHODS), n)
+
+        df = pd.DataFrame({
+            'customerID': [f'{seed}-{i:05d}' for i in range(n)],
+            'gender_encoded': rng.integers(0, 2, n),
+            'SeniorCitizen': rng.integers(0, 2, n),
+            'partner_encoded': rng.integers(0, 2, n),
+            'dependents_encoded': rng.integers(0, 2, n),
+            'tenure': tenure,
+            'tenure_years': tenure / 12,
+            'phone_service_encoded': rng.integers(0, 2, n),
+            'contract_encoded': rng.integers(0, 3, n),
+            'internet_service_encoded': rng.integers(0, 3, n),
+            'paperless_billing_encoded': rng.integers(0, 2, n),
+            'MonthlyCharges': monthly,
+            'TotalCharges': total,
+            'avg_monthly_spend': np.round(total / (tenure + 1), 2),
+            'charge_per_tenure': np.round(monthly / (tenure + 1), 2),
+            'total_services': rng.integers(0, 10, n),
+            'has_streaming': rng.integers(0, 2, n),
+            'has_security': rng.integers(0, 2, n),
+            'has_support': rng.integers(0, 2, n),
+            'is_long_term': (tenure > 24).astype(int),
+            'has_partner_or_dependent': rng.integers(0, 2, n),
+            'auto_payment': (payment < 2).astype(int),
+            'churn_encoded': rng.integers(0, 2, n)
+        })
+        for i, method in enumerate(PAYMENT_METHODS):
+            df[f'payment_{method}'] = payment == i
+        return df
+
+    return make
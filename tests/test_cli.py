@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from churn import config
+from churn.cli import main
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({'database': {}, 'paths': {}}))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(config.CONFIG_ENV_VAR, raising=False)
+    monkeypatch.setattr(config, '_cache', {})
+    return tmp_path
+
+def test_missing_config_exits_nonzero(tmp_path, monkeypatch):
+    monkeypatch.delenv(config.CONFIG_ENV_VAR, raising=False)
+
+    assert main(['--config', str(tmp_path / 'missing.json'), 'stats']) == 1
+
+def test_relative_paths_resolve_against_config(project, monkeypatch):
+    monkeypatch.chdir(project.parent)
+
+    paths = config.load_config(project / 'config.json')['paths']
+
+    assert paths['sketches'] == str(project / 'data' / 'sketches')
+    assert paths['sql_queries'] == str(project / 'sql_queries')
+
+def test_drift_without_sketches_exits_nonzero(project):
+    pytest.importorskip('numpy')
+
+    assert main(['drift']) == 1
+
+def test_rules_prints_views(project, capsys):
+    assert main(['rules']) == 0
+
+    out = capsys.readouterr().out
+    assert 'CREATE OR REPLACE VIEW at_risk_customers' in out
+    assert 'CREATE OR REPLACE VIEW high_risk_customers' in out
+
+def test_rules_rejects_invalid_rules(project, capsys):
+    (project / 'config.json').write_text(json.dumps({'risk_rules': {'rules': 'oops'}}))
+
+    assert main(['rules']) == 1
+    assert '✗ Invalid risk rules' in capsys.readouterr().out
+
+def test_load_rejects_invalid_rules_before_touching_the_database(project, capsys):
+    pytest.importorskip('mysql.connector')
+    (project / 'config.json').write_text(json.dumps({'risk_rules': {'categories': [['High Risk']]}}))
+
+    assert main(['load']) == 1
+    out = capsys.readouterr().out
+    assert '✗ Invalid risk rules' in out
+    assert 'Initializing database schema' not in out
+
+@pytest.mark.parametrize('use_flag', [False, True], ids=['env', 'flag'])
+def test_init_writes_the_config_main_will_read(project, monkeypatch, use_flag):
+    target = project / 'elsewhere' / 'config.json'
+    target.parent.mkdir()
+    monkeypatch.setattr('builtins.input', lambda prompt: '')
+    if use_flag:
+        argv = ['--config', str(target), 'init']
+    else:
+        monkeypatch.setenv(config.CONFIG_ENV_VAR, str(target))
+        argv = ['init']
+
+    main(argv)
+
+    assert json.loads(target.read_text())['database']['user'] == 'root'
+    assert json.loads((project / 'config.json').read_text()) == {'database': {}, 'paths': {}}
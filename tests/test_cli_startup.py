@@ -0,0 +1,55 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Total import time allowed for the `churn` package itself, in microseconds.
+# It measures ~10 ms; the slack absorbs slow CI machines, not new imports.
+IMPORT_BUDGET_US = 100_000
+
+HEAVY_MODULES = ('pandas', 'numpy', 'mysql.connector')
+
+def run_importtime(*args):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+
+    # "import time: self [us] | cumulative | imported package", children indented
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((name.rstrip(), int(cumulative)))
+    return imports
+
+def churn_import_us(imports):
+    return sum(cumulative for name, cumulative in imports
+               if name.strip() == name and name.startswith('churn'))
+
+@pytest.mark.parametrize('args', [
+    ('-c', 'import churn.cli'),
+    ('-m', 'churn', '--help'),
+], ids=['import', 'help'])
+def test_cli_startup_skips_heavy_imports(args):
+    imports = run_importtime(*args)
+    names = {name.strip() for name, _ in imports}
+
+    assert 'churn.cli' in names
+    for module in HEAVY_MODULES:
+        assert not any(name == module or name.startswith(module + '.') for name in names), module
+
+def test_cli_import_time_budget():
+    imports = run_importtime('-c', 'import churn.cli')
+
+    assert churn_import_us(imports) < IMPORT_BUDGET_US
+
+def test_risk_rules_compile_without_numpy():
+    # `churn rules` only prints SQL; numpy is for the in-memory scorer
+    imports = run_importtime('-c', 'import churn.risk_rules')
+
+    assert 'numpy' not in {name.strip() for name, _ in imports}
@@ -0,0 +1,123 @@
+import json
+import warnings
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from churn import config
+from churn.cli import main
+from churn.feature_sketches import (
+    NUMERIC_FEATURES, CATEGORICAL_FEATURES, Histogram, QuantileSketch, FeatureSketches,
+    save_sketches, load_sketches, population_stability_index, ks_statistic, compare_sketches
+)
+
+# Worst rank error accepted from a k=500 sketch; observed errors are ~0.2%
+RANK_ERROR = 0.01
+
+def sketch_frame(frame):
+    sketches = FeatureSketches()
+    # Several chunks, as the loaders feed it
+    for start in range(0, len(frame), 700):
+        sketches.update(frame.iloc[start:start + 700])
+    return sketches
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({'database': {}, 'paths': {}}))
+    monkeypatch.setenv(config.CONFIG_ENV_VAR, str(config_path))
+    monkeypatch.setattr(config, '_cache', {})
+    return tmp_path
+
+def test_histogram_edges():
+    histogram = Histogram(0, 10, 5)
+
+    histogram.update([0, 1.99, 2, 9.99, 10])
+
+    # underflow, [0, 2), [2, 4), ..., [8, 10], overflow
+    assert histogram.counts.tolist() == [0, 2, 1, 0, 0, 2, 0]
+
+def test_histogram_out_of_range_and_missing():
+    histogram = Histogram(0, 10, 5)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        histogram.update([-0.01, -np.inf, 10.01, np.inf, 1e300, np.nan, np.nan])
+
+    assert histogram.counts.tolist() == [2, 0, 0, 0, 0, 0, 3]
+    assert histogram.missing == 2
+
+def test_quantile_sketch_tracks_exact_quantiles():
+    values = np.random.default_rng(1).lognormal(3, 1, 100_000)
+    sketch = QuantileSketch()
+    for chunk in np.array_split(values, 137):
+        sketch.update(chunk)
+
+    _, weights = sketch.weighted_values()
+    assert weights.sum() == sketch.count == len(values)
+
+    qs = np.linspace(0.01, 0.99, 99)
+    estimates = np.asarray(sketch.quantiles(qs))
+    # Compare ranks, not values: the error bound is on the rank
+    ranks = np.searchsorted(np.sort(values), estimates, side='right') / len(values)
+    assert np.max(np.abs(ranks - qs)) <= RANK_ERROR
+
+def test_quantile_sketch_ignores_missing():
+    sketch = QuantileSketch()
+
+    sketch.update([1.0, np.nan, 3.0])
+
+    assert sketch.count == 2
+    assert sketch.quantiles([0.5]) == [1.0]
+
+def test_identical_sketches_do_not_drift(processed_frame):
+    frame = processed_frame(5000)
+    baseline, current = sketch_frame(frame), sketch_frame(frame)
+
+    for name in NUMERIC_FEATURES:
+        assert population_stability_index(baseline.histograms[name].counts,
+                                          current.histograms[name].counts) == 0
+        assert ks_statistic(baseline.quantiles[name], current.quantiles[name]) == 0
+    assert all(row['status'] == 'stable' for row in compare_sketches(baseline, current))
+
+def test_shifted_charges_drift(processed_frame):
+    baseline = sketch_frame(processed_frame(5000, seed=0))
+    current = sketch_frame(processed_frame(5000, shift=40, seed=1))
+
+    report = {row['feature']: row for row in compare_sketches(baseline, current)}
+
+    assert report['monthly_charges']['psi'] > 0.25
+    assert report['monthly_charges']['ks'] > 0.2
+    assert report['monthly_charges']['status'] == 'drift'
+    # Same generator, different seed: sampling noise only
+    assert report['tenure_months']['status'] == 'stable'
+
+def test_sketches_round_trip(processed_frame):
+    sketches = sketch_frame(processed_frame(3000))
+
+    restored = FeatureSketches.from_dict(json.loads(json.dumps(sketches.to_dict())))
+
+    assert restored.to_dict() == sketches.to_dict()
+    assert set(restored.categories) == set(CATEGORICAL_FEATURES)
+    assert restored.quantiles['tenure_months'].quantiles([0.5]) == \
+        sketches.quantiles['tenure_months'].quantiles([0.5])
+
+def test_first_load_becomes_baseline(processed_frame, tmp_path):
+    first = save_sketches(sketch_frame(processed_frame(500, seed=0)), tmp_path)
+    second = save_sketches(sketch_frame(processed_frame(800, seed=1)), tmp_path)
+
+    assert first != second
+    assert sorted(p.name for p in tmp_path.glob('load_*.json')) == [first.name, second.name]
+    _, baseline = load_sketches(tmp_path / 'baseline.json')
+    assert baseline.records == 500
+
+def test_drift_command_exit_codes(processed_frame, project):
+    sketches_dir = project / 'data' / 'sketches'
+    save_sketches(sketch_frame(processed_frame(3000, seed=0)), sketches_dir)
+    save_sketches(sketch_frame(processed_frame(3000, shift=40, seed=1)), sketches_dir)
+
+    assert main(['drift']) == 1
+    # Accepting the shifted load as the new normal clears the drift
+    assert main(['drift', '--set-baseline']) == 0
+    assert main(['drift']) == 0
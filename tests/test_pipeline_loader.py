@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('mysql.connector')
+
+from mysql.connector import Error, errorcode
+
+from churn import pipeline_loader, utils
+from churn.feature_sketches import FeatureSketches
+
+class FakeConnection:
+    # Stands in for a MySQL connection; every connection shares one log of
+    # committed rows so writes can be counted across writer threads
+    def __init__(self, committed, lock, failures):
+        self.committed = committed
+        self.lock = lock
+        self.failures = failures
+        self.pending = []
+
+    def cursor(self):
+        return self
+
+    def executemany(self, query, rows):
+        with self.lock:
+            if self.failures:
+                raise self.failures.pop(0)
+        table = query.split('INTO')[1].split()[0]
+        self.pending.extend((table, row[0]) for row in rows)
+
+    def commit(self):
+        with self.lock:
+            self.committed.extend(self.pending)
+        self.pending = []
+
+    def rollback(self):
+        self.pending = []
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def database(monkeypatch):
+    committed = []
+    failures = []
+    lock = threading.Lock()
+    connect = lambda: FakeConnection(committed, lock, failures)
+    monkeypatch.setattr(pipeline_loader, 'get_db_connection', connect)
+    monkeypatch.setattr(utils, 'get_db_connection', connect)
+    monkeypatch.setattr(pipeline_loader, '_RETRY_BACKOFF_SECONDS', 0)
+    return committed, failures
+
+@pytest.fixture
+def processed_csv(tmp_path, processed_frame):
+    path = tmp_path / 'customer_churn_processed.csv'
+    processed_frame(300).to_csv(path, index=False)
+    return path
+
+def committed_ids(committed, table):
+    return sorted(customer_id for t, customer_id in committed if t == table)
+
+def test_every_record_is_written_exactly_once(database, processed_csv):
+    committed, _ = database
+
+    assert pipeline_loader.load_data_to_db_pipelined(processed_csv, chunk_size=32, writers=3, queue_size=2)
+
+    customers = committed_ids(committed, 'customers')
+    assert len(customers) == 300 and len(set(customers)) == 300
+    for table in utils.INSERT_QUERIES:
+        assert committed_ids(committed, table) == customers
+
+def test_matches_serial_loader(database, processed_csv):
+    committed, _ = database
+    serial_sketches = FeatureSketches()
+    assert utils.load_data_to_db(processed_csv, sketches=serial_sketches)
+    serial = sorted(committed)
+
+    committed.clear()
+    pipelined_sketches = FeatureSketches()
+    assert pipeline_loader.load_data_to_db_pipelined(processed_csv, chunk_size=50, writers=2,
+                                                     sketches=pipelined_sketches)
+
+    assert sorted(committed) == serial
+    assert pipelined_sketches.to_dict() == serial_sketches.to_dict()
+
+def test_failing_writer_aborts_without_hanging(database, processed_csv):
+    _, failures = database
+    failures.append(Error(msg="Duplicate entry", errno=errorcode.ER_DUP_ENTRY))
+    result = []
+
+    thread = threading.Thread(target=lambda: result.append(pipeline_loader.load_data_to_db_pipelined(
+        processed_csv, chunk_size=10, writers=2, queue_size=1)))
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert result == [False]
+
+def test_deadlocked_batch_is_retried(database, processed_csv):
+    committed, failures = database
+    failures.extend([Error(msg="Deadlock found", errno=errorcode.ER_LOCK_DEADLOCK),
+                     Error(msg="Lock wait timeout", errno=errorcode.ER_LOCK_WAIT_TIMEOUT)])
+
+    assert pipeline_loader.load_data_to_db_pipelined(processed_csv, chunk_size=50, writers=2)
+    assert len(committed_ids(committed, 'customers')) == 300
+
+def test_persistent_deadlock_gives_up(database, processed_csv):
+    _, failures = database
+    failures.extend(Error(msg="Deadlock found", errno=errorcode.ER_LOCK_DEADLOCK)
+                    for _ in range(pipeline_loader._BATCH_RETRIES + 1))
+
+    assert not pipeline_loader.load_data_to_db_pipelined(processed_csv, chunk_size=300, writers=1)
+
+def test_missing_connection_aborts(monkeypatch, processed_csv):
+    monkeypatch.setattr(pipeline_loader, 'get_db_connection', lambda: None)
+
+    assert not pipeline_loader.load_data_to_db_pipelined(processed_csv, chunk_size=10, writers=2, queue_size=1)
+
+@pytest.mark.parametrize('sizes', [
+    {'writers': 0}, {'queue_size': 0}, {'queue_size': -1}, {'chunk_size': 0}
+])
+def test_invalid_sizes_are_rejected(processed_csv, sizes):
+    with pytest.raises(ValueError):
+        pipeline_loader.load_data_to_db_pipelined(processed_csv, **sizes)
@@ -0,0 +1,138 @@
+import math
+import sqlite3
+
+import pytest
+
+from churn.risk_rules import (
+    DEFAULT_RISK_RULES, load_risk_rules, compile_risk_views,
+    score_customers, categorize_scores
+)
+
+np = pytest.importorskip('numpy')
+
+NAN = float('nan')
+
+# One row per rule combination, plus missing values that must behave like NULL
+CUSTOMERS = {
+    'customer_id': ['c1', 'c2', 'c3', 'c4', 'c5', 'c6'],
+    'tenure_months': [5, 30, 11, NAN, 12, 70],
+    'contract_level': [0, 2, 0, 0, 1, NAN],
+    'total_services': [1, 5, 2, 1, 3, 4],
+    'monthly_charges': [80.5, 20.0, 75.0, NAN, 70.0, 99.0],
+    'has_family': [0, 1, 1, 0, 0, 1],
+    'target_churn': [1, 0, 1, 0, 0, 0]
+}
+
+def sql_risk(rules):
+    # Run the compiled views in SQLite, whose CASE / NULL semantics match
+    # MySQL for these expressions
+    db = sqlite3.connect(':memory:')
+    columns = [name for name in CUSTOMERS if name != 'customer_id']
+    db.execute(f"CREATE TABLE ml_feature_matrix (customer_id TEXT, {', '.join(columns)})")
+    db.execute("""
+        CREATE TABLE customer_complete_profile (
+            customer_id TEXT, tenure_months, monthly_charges,
+            contract_type TEXT, total_services, churn
+        )
+    """)
+
+    for i, customer_id in enumerate(CUSTOMERS['customer_id']):
+        row = [CUSTOMERS[name][i] for name in columns]
+        row = [None if isinstance(v, float) and math.isnan(v) else v for v in row]
+        db.execute(f"INSERT INTO ml_feature_matrix VALUES (?, {', '.join('?' * len(columns))})",
+                   [customer_id] + row)
+        db.execute("INSERT INTO customer_complete_profile VALUES (?, ?, ?, ?, ?, ?)",
+                   (customer_id, row[0], row[3], 'Month-to-month', row[2], row[5]))
+
+    for statement in compile_risk_views(rules):
+        db.execute(statement.replace('CREATE OR REPLACE VIEW', 'CREATE VIEW', 1))
+
+    scored = {
+        customer_id: (score, category)
+        for customer_id, score, category in
+        db.execute("SELECT customer_id, risk_score, risk_category FROM at_risk_customers")
+    }
+    high_risk = {row[0] for row in db.execute("SELECT customer_id FROM high_risk_customers")}
+    return scored, high_risk
+
+def numpy_risk(rules):
+    scores = score_customers(CUSTOMERS, rules)
+    categories = categorize_scores(scores, rules)
+    return {
+        customer_id: (score, category)
+        for customer_id, score, category in zip(CUSTOMERS['customer_id'], scores.tolist(), categories.tolist())
+    }
+
+@pytest.mark.parametrize('overrides', [
+    {},
+    # Ascending category order: first match wins in every path
+    {'categories': [['Medium Risk', 3], ['High Risk', 6]]},
+    {'rules': [{'name': 'new_off_plan', 'weight': 1.5,
+                'when': [['tenure_months', '<=', 12], ['monthly_charges', '!=', 70]]},
+               # != is the one comparison that is true for NaN but not NULL
+               {'name': 'odd_contract', 'weight': 2, 'when': [['contract_level', '!=', 1]]}],
+     'categories': [['High Risk', 1.5]]},
+], ids=['default', 'ascending-categories', 'custom'])
+def test_sql_and_numpy_scores_agree(overrides):
+    rules = load_risk_rules({'risk_rules': overrides})
+
+    scored, high_risk = sql_risk(rules)
+    expected = numpy_risk(rules)
+
+    assert scored == expected
+    assert high_risk == {
+        customer_id for customer_id, (_, category) in expected.items()
+        if category == rules['high_risk_category']
+    }
+
+def test_missing_values_never_match():
+    rules = load_risk_rules({})
+
+    # c4: unknown tenure and charges; only month_to_month, few_services and
+    # no_family can fire
+    assert numpy_risk(rules)['c4'] == (6, 'High Risk')
+
+def test_scores_single_customer():
+    rules = load_risk_rules({})
+    customer = {name: values[0] for name, values in CUSTOMERS.items()}
+
+    assert score_customers(customer, rules) == 11
+
+@pytest.mark.parametrize('overrides, message', [
+    ({'rules': []}, 'At least one risk rule'),
+    ({'categories': []}, 'At least one risk category'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['drop table', '<', 1]]}]}, 'unknown feature'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['target_churn', '=', 1]]}]}, 'unknown feature'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['tenure_months', 'LIKE', 1]]}]}, 'unsupported operator'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['tenure_months', '<', '12']]}]}, 'must be a finite number'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['tenure_months', '<', math.inf]]}]}, 'must be a finite number'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['tenure_months', '<', math.nan]]}]}, 'must be a finite number'),
+    ({'rules': [{'name': 'x', 'weight': '1', 'when': [['tenure_months', '<', 12]]}]}, 'numeric weight'),
+    ({'rules': [{'name': 'x', 'weight': -math.inf, 'when': [['tenure_months', '<', 12]]}]}, 'numeric weight'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': []}]}, 'no conditions'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': 'tenure_months < 12'}]}, 'no conditions'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['tenure_months', '<']]}]}, r'\[feature, operator, threshold\]'),
+    ({'rules': [{'name': 'x', 'weight': 1, 'when': [['tenure_months', '<', 12, 1]]}]}, r'\[feature, operator, threshold\]'),
+    ({'rules': [{'weight': 1, 'when': [['tenure_months', '<', 12]]}]}, 'needs a name'),
+    ({'rules': ['new_customer']}, 'needs a name'),
+    ({'rules': 'oops'}, 'must be a list'),
+    ({'categories': 'oops'}, 'must be a list'),
+    ({'categories': [['High Risk', 'six']]}, 'numeric minimum score'),
+    ({'categories': [['High Risk', math.inf]]}, 'numeric minimum score'),
+    ({'categories': [['High Risk']]}, r'\[name, minimum score\]'),
+    ({'categories': [['High Risk', 6, 1]]}, r'\[name, minimum score\]'),
+    ({'default_category': None}, 'must be a string'),
+    ({'high_risk_category': 'Critical'}, 'Unknown high risk category'),
+])
+def test_invalid_rules_are_rejected(overrides, message):
+    with pytest.raises(ValueError, match=message):
+        load_risk_rules({'risk_rules': overrides})
+
+def test_risk_rules_must_be_an_object():
+    with pytest.raises(ValueError, match='must be an object'):
+        load_risk_rules({'risk_rules': []})
+
+def test_defaults_are_not_mutated():
+    load_risk_rules({'risk_rules': {'categories': [['High Risk', 1]]}})
+
+    assert DEFAULT_RISK_RULES['categories'] == [['High Risk', 6], ['Medium Risk', 3]]